@@ -44,6 +44,7 @@ from . import cfour
 from . import jajo
 from . import orca
 from .dbwrap import Database, DB4  #DatabaseWrapper, ReactionDatum, Reagent, Reaction
+from .lazygeos import LazyGeometryDict
 from .libmintspointgrp import SymmetryOperation, PointGroup
 from .libmintsbasisset import BasisSet
 from .libmintsmolecule import LibmintsMolecule
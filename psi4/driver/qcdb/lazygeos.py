@@ -0,0 +1,81 @@
+#
+# @BEGIN LICENSE
+#
+# Psi4: an open-source quantum chemistry software package
+#
+# Copyright (c) 2007-2019 The Psi4 Developers.
+#
+# The copyrights for code used from other parties are included in
+# the corresponding files.
+#
+# This file is part of Psi4.
+#
+# Psi4 is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, version 3.
+#
+# Psi4 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Psi4; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# @END LICENSE
+#
+
+from collections.abc import ItemsView, ValuesView
+
+from .molecule import Molecule
+
+
+class LazyGeometryDict(dict):
+    r"""Class to store the GEOS geometries of a database module. Extends
+    the dictionary object to construct each :py:class:`~qcdb.Molecule`
+    only when it is first retrieved, so that importing a database does
+    not parse every geometry it defines. A value may be stored as a
+    finished Molecule, as a Molecule specification string, or as a
+    zero-argument callable returning a Molecule (see :py:meth:`fragments`).
+    Strings and callables are replaced in place by their Molecule upon
+    first access through indexing, :py:meth:`get`, :py:meth:`values`, or
+    :py:meth:`items`.
+
+    >>> GEOS = qcdb.LazyGeometryDict()
+    >>> GEOS['HeHe-dimer'] = 'He 0 0 0\n--\nHe 0 0 3\n'
+    >>> GEOS['HeHe-monoA-CP'] = GEOS.fragments('HeHe-dimer', 1, 2)
+    >>> GEOS['HeHe-monoA-CP'].natom()  # dimer, then monomer, built here
+    2
+
+    """
+
+    def __getitem__(self, key):
+        value = super(LazyGeometryDict, self).__getitem__(key)
+        if isinstance(value, str):
+            value = Molecule(value)
+            super(LazyGeometryDict, self).__setitem__(key, value)
+        elif callable(value):
+            value = value()
+            super(LazyGeometryDict, self).__setitem__(key, value)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def values(self):
+        return ValuesView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def fragments(self, key, reals, ghosts=[]):
+        """Returns a deferred geometry that, when built, applies
+        :py:func:`~qcdb.Molecule.extract_fragments` with *reals* and
+        *ghosts* to the geometry stored at *key*. Use as a value to
+        define monomers from a dimer without building the dimer.
+
+        """
+        return lambda: self[key].extract_fragments(reals, ghosts)
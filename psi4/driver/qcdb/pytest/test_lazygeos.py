@@ -0,0 +1,52 @@
+from utils import *
+
+import qcdb
+
+hehe = """
+0 1
+He 0.0 0.0 -1.5
+--
+0 1
+He 0.0 0.0  1.5
+units angstrom
+"""
+
+
+def _raw(geos, key):
+    return dict.__getitem__(geos, key)
+
+
+def test_lazygeos_string_built_on_access():
+    GEOS = qcdb.LazyGeometryDict()
+    GEOS['HeHe-dimer'] = hehe
+
+    assert compare_integers(True, _raw(GEOS, 'HeHe-dimer') is hehe, 'L: stored unparsed')
+    mol = GEOS['HeHe-dimer']
+    assert compare_integers(True, type(mol) == qcdb.Molecule, 'L: built on access')
+    assert compare_integers(2, mol.natom(), 'L: natom')
+    assert compare_integers(True, GEOS['HeHe-dimer'] is mol, 'L: memoized')
+
+
+def test_lazygeos_fragments():
+    GEOS = qcdb.LazyGeometryDict()
+    GEOS['HeHe-dimer'] = hehe
+    GEOS['HeHe-monoA-unCP'] = GEOS.fragments('HeHe-dimer', 1)
+    GEOS['HeHe-monoB-CP'] = GEOS.fragments('HeHe-dimer', 2, 1)
+
+    ref = qcdb.Molecule(hehe)
+    monoB = GEOS['HeHe-monoB-CP']
+    assert compare_integers(1, GEOS['HeHe-monoA-unCP'].natom(), 'L: unCP natom')
+    assert compare_integers(2, monoB.natom(), 'L: CP natom')
+    assert compare_values(ref.extract_fragments(2, 1).nuclear_repulsion_energy(), monoB.nuclear_repulsion_energy(), 8,
+                          'L: CP nre')
+
+
+def test_lazygeos_items_values_get():
+    GEOS = qcdb.LazyGeometryDict()
+    GEOS['HeHe-dimer'] = hehe
+    GEOS['HeHe-monoA-CP'] = GEOS.fragments('HeHe-dimer', 1, 2)
+
+    assert compare_integers(True, all(type(mol) == qcdb.Molecule for _, mol in GEOS.items()), 'L: items built')
+    assert compare_integers(True, all(type(mol) == qcdb.Molecule for mol in GEOS.values()), 'L: values built')
+    assert compare_integers(True, GEOS.get('HeHe-dimer') is GEOS['HeHe-dimer'], 'L: get')
+    assert compare_integers(True, GEOS.get('HeHe-trimer') is None, 'L: get default')
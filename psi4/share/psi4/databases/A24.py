@@ -49,7 +49,6 @@
   - ``'<subset>'`` <members_description>
 
 """
-import re
 import qcdb
 
 # <<< A24 Database Module >>>
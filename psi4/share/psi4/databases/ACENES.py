@@ -43,7 +43,6 @@
   - ``'FIRST10'`` benzene - decacene dimers
 
 """
-import re
 import qcdb
 
 # <<< ACENES Database Module >>>
@@ -43,7 +43,6 @@
   - ``'large'``
 
 """
-import re
 import qcdb
 
 # <<< BAKERJCC93 Database Module >>>
@@ -36,7 +36,6 @@
 - **rlxd** ``'off'``
 
 """
-import re
 import qcdb
 
 # <<< BAKERJCC96 Database Module >>>
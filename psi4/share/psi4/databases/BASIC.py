@@ -37,7 +37,6 @@
 - **subset** [``'h2o'``, ``'nh3'``, ``'ch4'``]
 
 """
-import re
 import qcdb
 
 # <<< BASIC Database Module >>>
@@ -52,7 +52,6 @@
   - ``'S22_DD'`` 
 
 """
-import re
 import qcdb
 
 # <<< BENCH12 Database Module >>>
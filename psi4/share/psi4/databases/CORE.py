@@ -34,7 +34,6 @@
 - **rlxd** ``'off'``
 
 """
-import re
 import qcdb
 
 # <<< CORE Database Module >>>
@@ -41,7 +41,6 @@
   - ``'large'``
 
 """
-import re
 import qcdb
 
 # <<< HTBH Database Module >>>
@@ -44,7 +44,6 @@
   - ``'<subset>'`` <members_description>
 
 """
-import re
 import qcdb
 
 # <<< HTR40 Database Module >>>
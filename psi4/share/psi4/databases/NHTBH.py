@@ -40,7 +40,6 @@
   - ``'large'``
 
 """
-import re
 import qcdb
 
 # <<< NHTBH Database Module >>>
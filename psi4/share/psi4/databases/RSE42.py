@@ -45,7 +45,6 @@
   - ``'<subset>'`` <members_description>
 
 """
-import re
 import qcdb
 
 # <<< RSE42 Database Module >>>
@@ -45,69 +45,45 @@
   - ``'mol22'`` five-point (0.9, 1.0, 1.2, 1.5, 2.0) :math:`\\times R_{eq}` dissociation curve for molecule 22
 
 """
-import re
+import sys
 import qcdb
 
 # <<< S22by5 Database Module >>>
 dbse = 'S22by5'
 
 # <<< Database Members >>>
-mol1  = []
-mol2  = []
-mol3  = []
-mol4  = []
-mol5  = []
-mol6  = []
-mol7  = []
-mol8  = []
-mol9  = []
-mol10 = []
-mol11 = []
-mol12 = []
-mol13 = []
-mol14 = []
-mol15 = []
-mol16 = []
-mol17 = []
-mol18 = []
-mol19 = []
-mol20 = []
-mol21 = []
-mol22 = []
 dist = [0.9, 1.0, 1.2, 1.5, 2.0]
-for d in dist:
-    mol1.append('1-' + str(d))
-    mol2.append('2-' + str(d))
-    mol3.append('3-' + str(d))
-    mol4.append('4-' + str(d))
-    mol5.append('5-' + str(d))
-    mol6.append('6-' + str(d))
-    mol7.append('7-' + str(d))
-    mol8.append('8-' + str(d))
-    mol9.append('9-' + str(d))
-    mol10.append('10-' + str(d))
-    mol11.append('11-' + str(d))
-    mol12.append('12-' + str(d))
-    mol13.append('13-' + str(d))
-    mol14.append('14-' + str(d))
-    mol15.append('15-' + str(d))
-    mol16.append('16-' + str(d))
-    mol17.append('17-' + str(d))
-    mol18.append('18-' + str(d))
-    mol19.append('19-' + str(d))
-    mol20.append('20-' + str(d))
-    mol21.append('21-' + str(d))
-    mol22.append('22-' + str(d))
+_sdist = [str(d) for d in dist]
+mol1  = ['1-'  + d for d in _sdist]
+mol2  = ['2-'  + d for d in _sdist]
+mol3  = ['3-'  + d for d in _sdist]
+mol4  = ['4-'  + d for d in _sdist]
+mol5  = ['5-'  + d for d in _sdist]
+mol6  = ['6-'  + d for d in _sdist]
+mol7  = ['7-'  + d for d in _sdist]
+mol8  = ['8-'  + d for d in _sdist]
+mol9  = ['9-'  + d for d in _sdist]
+mol10 = ['10-' + d for d in _sdist]
+mol11 = ['11-' + d for d in _sdist]
+mol12 = ['12-' + d for d in _sdist]
+mol13 = ['13-' + d for d in _sdist]
+mol14 = ['14-' + d for d in _sdist]
+mol15 = ['15-' + d for d in _sdist]
+mol16 = ['16-' + d for d in _sdist]
+mol17 = ['17-' + d for d in _sdist]
+mol18 = ['18-' + d for d in _sdist]
+mol19 = ['19-' + d for d in _sdist]
+mol20 = ['20-' + d for d in _sdist]
+mol21 = ['21-' + d for d in _sdist]
+mol22 = ['22-' + d for d in _sdist]
 
 temp = [mol1, mol2, mol3, mol4,  mol5, mol6, mol7, mol8, mol9, mol10, mol11,
         mol12, mol13, mol14, mol15,  mol16, mol17, mol18, mol19, mol20, mol21, mol22]
-HRXN = sum(temp, [])
+HRXN = [rxn for mol in temp for rxn in mol]
 
 HRXN_SM = ['1-0.9', '2-1.0', '8-1.5', '16-2.0']
 HRXN_LG = ['15-0.9']
-HRXN_EQ = []
-for m in range(1, 23):
-    HRXN_EQ.append(str(m) + '-1.0')
+HRXN_EQ = [f'{m}-1.0' for m in range(1, 23)]
 
 # <<< Chemical Systems Involved >>>
 RXNM = {}     # reaction matrix of reagent contributions per reaction
@@ -116,341 +92,102 @@ ACTV_CP = {}  # order of active reagents per counterpoise-corrected reaction
 ACTV_SA = {}  # order of active reagents for non-supramolecular calculations
 
 for rxn in HRXN:
+    # format each reaction and reagent label once and share it across the tables;
+    #   interned so that TAGL and GEOS below reuse the very same key objects
+    rxnkey = sys.intern(f'{dbse}-{rxn}')
+    dimer = sys.intern(f'{rxnkey}-dimer')
+    monoA_CP = sys.intern(f'{rxnkey}-monoA-CP')
+    monoB_CP = sys.intern(f'{rxnkey}-monoB-CP')
+    monoA_unCP = sys.intern(f'{rxnkey}-monoA-unCP')
+    monoB_unCP = sys.intern(f'{rxnkey}-monoB-unCP')
 
-    RXNM[   '%s-%s' % (dbse, rxn)] = {'%s-%s-dimer'      % (dbse, rxn) : +1,
-                                      '%s-%s-monoA-CP'   % (dbse, rxn) : -1,
-                                      '%s-%s-monoB-CP'   % (dbse, rxn) : -1,
-                                      '%s-%s-monoA-unCP' % (dbse, rxn) : -1,
-                                      '%s-%s-monoB-unCP' % (dbse, rxn) : -1 }
+    RXNM[   rxnkey] = {dimer      : +1,
+                       monoA_CP   : -1,
+                       monoB_CP   : -1,
+                       monoA_unCP : -1,
+                       monoB_unCP : -1 }
 
-    ACTV_SA['%s-%s' % (dbse, rxn)] = ['%s-%s-dimer'      % (dbse, rxn) ]
+    ACTV_SA[rxnkey] = [dimer]
 
-    ACTV_CP['%s-%s' % (dbse, rxn)] = ['%s-%s-dimer'      % (dbse, rxn),
-                                      '%s-%s-monoA-CP'   % (dbse, rxn),
-                                      '%s-%s-monoB-CP'   % (dbse, rxn) ]
+    ACTV_CP[rxnkey] = [dimer, monoA_CP, monoB_CP]
 
-    ACTV[   '%s-%s' % (dbse, rxn)] = ['%s-%s-dimer'      % (dbse, rxn),
-                                      '%s-%s-monoA-unCP' % (dbse, rxn),
-                                      '%s-%s-monoB-unCP' % (dbse, rxn) ]
+    ACTV[   rxnkey] = [dimer, monoA_unCP, monoB_unCP]
 
 # <<< Reference Values >>>
-BIND = {}
-BIND['%s-1-0.9'  % (dbse)] =  -2.41
-BIND['%s-1-1.0'  % (dbse)] =  -3.14
-BIND['%s-1-1.2'  % (dbse)] =  -2.36
-BIND['%s-1-1.5'  % (dbse)] =  -1.11
-BIND['%s-1-2.0'  % (dbse)] =  -0.36
-BIND['%s-2-0.9'  % (dbse)] =  -4.32
-BIND['%s-2-1.0'  % (dbse)] =  -4.97
-BIND['%s-2-1.2'  % (dbse)] =  -4.04
-BIND['%s-2-1.5'  % (dbse)] =  -2.29
-BIND['%s-2-2.0'  % (dbse)] =  -0.96
-BIND['%s-3-0.9'  % (dbse)] = -16.34
-BIND['%s-3-1.0'  % (dbse)] = -18.59
-BIND['%s-3-1.2'  % (dbse)] = -15.62
-BIND['%s-3-1.5'  % (dbse)] =  -9.24
-BIND['%s-3-2.0'  % (dbse)] =  -3.63
-BIND['%s-4-0.9'  % (dbse)] = -14.14
-BIND['%s-4-1.0'  % (dbse)] = -15.95
-BIND['%s-4-1.2'  % (dbse)] = -13.40
-BIND['%s-4-1.5'  % (dbse)] =  -8.10
-BIND['%s-4-2.0'  % (dbse)] =  -3.51
-BIND['%s-5-0.9'  % (dbse)] = -18.73
-BIND['%s-5-1.0'  % (dbse)] = -20.46
-BIND['%s-5-1.2'  % (dbse)] = -17.16
-BIND['%s-5-1.5'  % (dbse)] = -10.46
-BIND['%s-5-2.0'  % (dbse)] =  -4.58
-BIND['%s-6-0.9'  % (dbse)] = -15.13
-BIND['%s-6-1.0'  % (dbse)] = -16.70
-BIND['%s-6-1.2'  % (dbse)] = -13.93
-BIND['%s-6-1.5'  % (dbse)] =  -8.18
-BIND['%s-6-2.0'  % (dbse)] =  -3.26
-BIND['%s-7-0.9'  % (dbse)] = -15.02
-BIND['%s-7-1.0'  % (dbse)] = -16.37
-BIND['%s-7-1.2'  % (dbse)] = -13.30
-BIND['%s-7-1.5'  % (dbse)] =  -7.43
-BIND['%s-7-2.0'  % (dbse)] =  -2.59
-BIND['%s-8-0.9'  % (dbse)] =  -0.34
-BIND['%s-8-1.0'  % (dbse)] =  -0.53
-BIND['%s-8-1.2'  % (dbse)] =  -0.25
-BIND['%s-8-1.5'  % (dbse)] =  -0.06
-BIND['%s-8-2.0'  % (dbse)] =  -0.01
-BIND['%s-9-0.9'  % (dbse)] =  -0.68
-BIND['%s-9-1.0'  % (dbse)] =  -1.48
-BIND['%s-9-1.2'  % (dbse)] =  -0.81
-BIND['%s-9-1.5'  % (dbse)] =  -0.20
-BIND['%s-9-2.0'  % (dbse)] =  -0.03
-BIND['%s-10-0.9' % (dbse)] =  -1.09
-BIND['%s-10-1.0' % (dbse)] =  -1.50
-BIND['%s-10-1.2' % (dbse)] =  -1.13
-BIND['%s-10-1.5' % (dbse)] =  -0.48
-BIND['%s-10-2.0' % (dbse)] =  -0.12
-BIND['%s-11-0.9' % (dbse)] =  -0.15
-BIND['%s-11-1.0' % (dbse)] =  -2.81
-BIND['%s-11-1.2' % (dbse)] =  -1.92
-BIND['%s-11-1.5' % (dbse)] =  -0.53
-BIND['%s-11-2.0' % (dbse)] =  -0.07
-BIND['%s-12-0.9' % (dbse)] =  -1.69
-BIND['%s-12-1.0' % (dbse)] =  -4.51
-BIND['%s-12-1.2' % (dbse)] =  -3.02
-BIND['%s-12-1.5' % (dbse)] =  -0.98
-BIND['%s-12-2.0' % (dbse)] =  -0.19
-BIND['%s-13-0.9' % (dbse)] =  -6.76
-BIND['%s-13-1.0' % (dbse)] =  -9.87
-BIND['%s-13-1.2' % (dbse)] =  -6.26
-BIND['%s-13-1.5' % (dbse)] =  -2.42
-BIND['%s-13-2.0' % (dbse)] =  -0.69
-BIND['%s-14-0.9' % (dbse)] =  -2.13
-BIND['%s-14-1.0' % (dbse)] =  -5.18
-BIND['%s-14-1.2' % (dbse)] =  -3.61
-BIND['%s-14-1.5' % (dbse)] =  -1.08
-BIND['%s-14-2.0' % (dbse)] =  -0.10
-BIND['%s-15-0.9' % (dbse)] =  -7.99
-BIND['%s-15-1.0' % (dbse)] = -12.22
-BIND['%s-15-1.2' % (dbse)] =  -8.23
-BIND['%s-15-1.5' % (dbse)] =  -3.25
-BIND['%s-15-2.0' % (dbse)] =  -0.92
-BIND['%s-16-0.9' % (dbse)] =  -1.17
-BIND['%s-16-1.0' % (dbse)] =  -1.49
-BIND['%s-16-1.2' % (dbse)] =  -1.08
-BIND['%s-16-1.5' % (dbse)] =  -0.49
-BIND['%s-16-2.0' % (dbse)] =  -0.15
-BIND['%s-17-0.9' % (dbse)] =  -3.01
-BIND['%s-17-1.0' % (dbse)] =  -3.27
-BIND['%s-17-1.2' % (dbse)] =  -2.47
-BIND['%s-17-1.5' % (dbse)] =  -1.30
-BIND['%s-17-2.0' % (dbse)] =  -0.49
-BIND['%s-18-0.9' % (dbse)] =  -2.04
-BIND['%s-18-1.0' % (dbse)] =  -2.35
-BIND['%s-18-1.2' % (dbse)] =  -1.75
-BIND['%s-18-1.5' % (dbse)] =  -0.85
-BIND['%s-18-2.0' % (dbse)] =  -0.28
-BIND['%s-19-0.9' % (dbse)] =  -4.02
-BIND['%s-19-1.0' % (dbse)] =  -4.52
-BIND['%s-19-1.2' % (dbse)] =  -3.68
-BIND['%s-19-1.5' % (dbse)] =  -2.09
-BIND['%s-19-2.0' % (dbse)] =  -0.85
-BIND['%s-20-0.9' % (dbse)] =  -2.20
-BIND['%s-20-1.0' % (dbse)] =  -2.80
-BIND['%s-20-1.2' % (dbse)] =  -2.25
-BIND['%s-20-1.5' % (dbse)] =  -1.12
-BIND['%s-20-2.0' % (dbse)] =  -0.35
-BIND['%s-21-0.9' % (dbse)] =  -4.99
-BIND['%s-21-1.0' % (dbse)] =  -5.74
-BIND['%s-21-1.2' % (dbse)] =  -4.88
-BIND['%s-21-1.5' % (dbse)] =  -2.80
-BIND['%s-21-2.0' % (dbse)] =  -1.10
-BIND['%s-22-0.9' % (dbse)] =  -6.42
-BIND['%s-22-1.0' % (dbse)] =  -7.05
-BIND['%s-22-1.2' % (dbse)] =  -5.79
-BIND['%s-22-1.5' % (dbse)] =  -3.41
-BIND['%s-22-2.0' % (dbse)] =  -1.38
+# rows are molecules 1-22, columns are the dist scalings of R_eq
+_bind = [
+    ( -2.41,  -3.14,  -2.36,  -1.11,  -0.36),  # 1
+    ( -4.32,  -4.97,  -4.04,  -2.29,  -0.96),  # 2
+    (-16.34, -18.59, -15.62,  -9.24,  -3.63),  # 3
+    (-14.14, -15.95, -13.40,  -8.10,  -3.51),  # 4
+    (-18.73, -20.46, -17.16, -10.46,  -4.58),  # 5
+    (-15.13, -16.70, -13.93,  -8.18,  -3.26),  # 6
+    (-15.02, -16.37, -13.30,  -7.43,  -2.59),  # 7
+    ( -0.34,  -0.53,  -0.25,  -0.06,  -0.01),  # 8
+    ( -0.68,  -1.48,  -0.81,  -0.20,  -0.03),  # 9
+    ( -1.09,  -1.50,  -1.13,  -0.48,  -0.12),  # 10
+    ( -0.15,  -2.81,  -1.92,  -0.53,  -0.07),  # 11
+    ( -1.69,  -4.51,  -3.02,  -0.98,  -0.19),  # 12
+    ( -6.76,  -9.87,  -6.26,  -2.42,  -0.69),  # 13
+    ( -2.13,  -5.18,  -3.61,  -1.08,  -0.10),  # 14
+    ( -7.99, -12.22,  -8.23,  -3.25,  -0.92),  # 15
+    ( -1.17,  -1.49,  -1.08,  -0.49,  -0.15),  # 16
+    ( -3.01,  -3.27,  -2.47,  -1.30,  -0.49),  # 17
+    ( -2.04,  -2.35,  -1.75,  -0.85,  -0.28),  # 18
+    ( -4.02,  -4.52,  -3.68,  -2.09,  -0.85),  # 19
+    ( -2.20,  -2.80,  -2.25,  -1.12,  -0.35),  # 20
+    ( -4.99,  -5.74,  -4.88,  -2.80,  -1.10),  # 21
+    ( -6.42,  -7.05,  -5.79,  -3.41,  -1.38),  # 22
+]
+BIND = {f'{dbse}-{mol}-{d}': val
+        for mol, row in enumerate(_bind, start=1)
+        for d, val in zip(dist, row)}
 
 # <<< Comment Lines >>>
 TAGL = {}
-rxnpattern = re.compile(r'^(.+)-(.+)$')
-for item in mol1:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'HB-1 Ammonia Dimer at %s Req, C2H' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Ammonia Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Ammonia from Ammonia Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Ammonia from Ammonia Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Ammonia from Ammonia Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Ammonia from Ammonia Dimer at %s Req' % (molname.group(2))
-
-for item in mol2:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'HB-2 Water Dimer at %s Req, CS' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Water Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Water from Water Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Water from Water Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Water from Water Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Water from Water Dimer at %s Req' % (molname.group(2))
-
-for item in mol3:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'HB-3 Formic Acid Dimer at %s Req, C2H' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Formic Acid Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Formic Acid from Formic Acid Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Formic Acid from Formic Acid Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Formic Acid from Formic Acid Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Formic Acid from Formic Acid Dimer at %s Req' % (molname.group(2))
-
-for item in mol4:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'HB-4 Formamide Dimer at %s Req, C2H' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Formamide Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Formamide from Formamide Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Formamide from Formamide Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Formamide from Formamide Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Formamide from Formamide Dimer at %s Req' % (molname.group(2))
-
-for item in mol5:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'HB-5 Uracil Dimer HB at %s Req, C2H' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Uracil Dimer HB at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Uracil from Uracil Dimer HB at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Uracil from Uracil Dimer HB at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Uracil from Uracil Dimer HB at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Uracil from Uracil Dimer HB at %s Req' % (molname.group(2))
-
-for item in mol6:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'HB-6 2-Pyridone-2-Aminopyridine Complex at %s Req, C1' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      '2-Pyridone-2-Aminopyridine Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      '2-Pyridone from 2-Pyridone-2-Aminopyridine Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      '2-Aminopyridine from 2-Pyridone-2-Aminopyridine Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      '2-Pyridone from 2-Pyridone-2-Aminopyridine Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      '2-Aminopyridine from 2-Pyridone-2-Aminopyridine Complex at %s Req' % (molname.group(2))
-
-for item in mol7:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'HB-7 Adenine-Thymine Complex WC at %s Req, C1' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Adenine-Thymine Complex WC at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Adenine from Adenine-Thymine Complex WC at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Thymine from Adenine-Thymine Complex WC at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Adenine from Adenine-Thymine Complex WC at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Thymine from Adenine-Thymine Complex WC at %s Req' % (molname.group(2))
-
-for item in mol8:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'DD-1 Methane Dimer at %s Req, D3D' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Methane Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Methane from Methane Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Methane from Methane Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Methane from Methane Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Methane from Methane Dimer at %s Req' % (molname.group(2))
-
-for item in mol9:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'DD-2 Ethene Dimer at %s Req, D2D' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Ethene Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Ethene from Ethene Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Ethene from Ethene Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Ethene from Ethene Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Ethene from Ethene Dimer at %s Req' % (molname.group(2))
-
-for item in mol10:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'DD-3 Benzene-Methane Complex at %s Req, C3' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Benzene-Methane Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Benzene from Benzene-Methane Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Methane from Benzene-Methane Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Benzene from Benzene-Methane Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Methane from Benzene-Methane Complex at %s Req' % (molname.group(2))
-
-for item in mol11:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'DD-4 Benzene Dimer Parallel-Disp at %s Req, C2H' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Benzene Dimer PD at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Benzene from Benzene Dimer PD at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Benzene from Benzene Dimer PD at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Benzene from Benzene Dimer PD at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Benzene from Benzene Dimer PD at %s Req' % (molname.group(2))
-
-for item in mol12:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'DD-6 Pyrazine Dimer at %s Req, CS' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Pyrazine Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Pyrazine from Pyrazine Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Pyrazine from Pyrazine Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Pyrazine from Pyrazine Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Pyrazine from Pyrazine Dimer at %s Req' % (molname.group(2))
-
-for item in mol13:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'MX-5 Uracil Dimer Stack at %s Req, C2' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Uracil Dimer Stack at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Uracil from Uracil Dimer Stack at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Uracil from Uracil Dimer Stack at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Uracil from Uracil Dimer Stack at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Uracil from Uracil Dimer Stack at %s Req' % (molname.group(2))
-
-for item in mol14:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'DD-7 Indole-Benzene Complex Stack at %s Req, C1' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Indole-Benzene Complex Stack at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Benzene from Indole-Benzene Complex Stack at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Indole from Indole-Benzene Complex Stack at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Benzene from Indole-Benzene Complex Stack at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Indole from Indole-Benzene Complex Stack at %s Req' % (molname.group(2))
-
-for item in mol15:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'MX-8 Adenine-Thymine Complex Stack at %s Req, C1' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Adenine-Thymine Complex Stack at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Adenine from Adenine-Thymine Complex Stack at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Thymine from Adenine-Thymine Complex Stack at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Adenine from Adenine-Thymine Complex Stack at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Thymine from Adenine-Thymine Complex Stack at %s Req' % (molname.group(2))
-
-for item in mol16:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'MX-1 Ethene-Ethine Complex at %s Req, C2V' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Ethene-Ethine Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Ethene from Ethene-Ethine Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Ethine from Ethene-Ethine Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Ethene from Ethene-Ethine Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Ethine from Ethene-Ethine Complex at %s Req' % (molname.group(2))
-
-for item in mol17:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'MX-2 Benzene-Water Complex at %s Req, CS' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Benzene-Water Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Benzene from Benzene-Water Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Water from Benzene-Water Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Benzene from Benzene-Water Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Water from Benzene-Water Complex at %s Req' % (molname.group(2))
-
-for item in mol18:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'MX-3 Benzene-Ammonia Complex at %s Req, CS' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Benzene-Ammonia Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Benzene from Benzene-Ammonia Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Ammonia from Benzene-Ammonia Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Benzene from Benzene-Ammonia Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Ammonia from Benzene-Ammonia Complex at %s Req' % (molname.group(2))
-
-for item in mol19:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'MX-4 Benzene-HCN Complex at %s Req, CS' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Benzene-HCN Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Benzene from Benzene-HCN Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'HCN from Benzene-HCN Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Benzene from Benzene-HCN Complex at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'HCN from Benzene-HCN Complex at %s Req' % (molname.group(2))
-
-for item in mol20:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'DD-5 Benzene Dimer T-Shape at %s Req, C2V' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Benzene Dimer T-Shape at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Benzene from Benzene Dimer T-Shape at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Benzene from Benzene Dimer T-Shape at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Benzene from Benzene Dimer T-Shape at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Benzene from Benzene Dimer T-Shape at %s Req' % (molname.group(2))
-
-for item in mol21:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'MX-6 Indole-Benzene Complex T-Shape at %s Req, C1' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Indole-Benzene Complex T-Shape at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Benzene from Indole-Benzene Complex T-Shape at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Indole from Indole-Benzene Complex T-Shape at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Benzene from Indole-Benzene Complex T-Shape at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Indole from Indole-Benzene Complex T-Shape at %s Req' % (molname.group(2))
-
-for item in mol22:
-    molname = rxnpattern.match(item)
-    TAGL['%s-%s'            % (dbse, item)] = 'MX-7 Phenol Dimer at %s Req, C1' % (molname.group(2))
-    TAGL['%s-%s-dimer'      % (dbse, item)] =      'Phenol Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-CP'   % (dbse, item)] =      'Phenol from Phenol Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-CP'   % (dbse, item)] =      'Phenol from Phenol Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoA-unCP' % (dbse, item)] =      'Phenol from Phenol Dimer at %s Req' % (molname.group(2))
-    TAGL['%s-%s-monoB-unCP' % (dbse, item)] =      'Phenol from Phenol Dimer at %s Req' % (molname.group(2))
+# (reaction, point group, complex, monomer A, monomer B) for molecules 1-22
+_tagl = [
+    ('HB-1 Ammonia Dimer',                      'C2H', 'Ammonia Dimer',                      'Ammonia',     'Ammonia'),
+    ('HB-2 Water Dimer',                        'CS',  'Water Dimer',                        'Water',       'Water'),
+    ('HB-3 Formic Acid Dimer',                  'C2H', 'Formic Acid Dimer',                  'Formic Acid', 'Formic Acid'),
+    ('HB-4 Formamide Dimer',                    'C2H', 'Formamide Dimer',                    'Formamide',   'Formamide'),
+    ('HB-5 Uracil Dimer HB',                    'C2H', 'Uracil Dimer HB',                    'Uracil',      'Uracil'),
+    ('HB-6 2-Pyridone-2-Aminopyridine Complex', 'C1',  '2-Pyridone-2-Aminopyridine Complex', '2-Pyridone',  '2-Aminopyridine'),
+    ('HB-7 Adenine-Thymine Complex WC',         'C1',  'Adenine-Thymine Complex WC',         'Adenine',     'Thymine'),
+    ('DD-1 Methane Dimer',                      'D3D', 'Methane Dimer',                      'Methane',     'Methane'),
+    ('DD-2 Ethene Dimer',                       'D2D', 'Ethene Dimer',                       'Ethene',      'Ethene'),
+    ('DD-3 Benzene-Methane Complex',            'C3',  'Benzene-Methane Complex',            'Benzene',     'Methane'),
+    ('DD-4 Benzene Dimer Parallel-Disp',        'C2H', 'Benzene Dimer PD',                   'Benzene',     'Benzene'),
+    ('DD-6 Pyrazine Dimer',                     'CS',  'Pyrazine Dimer',                     'Pyrazine',    'Pyrazine'),
+    ('MX-5 Uracil Dimer Stack',                 'C2',  'Uracil Dimer Stack',                 'Uracil',      'Uracil'),
+    ('DD-7 Indole-Benzene Complex Stack',       'C1',  'Indole-Benzene Complex Stack',       'Benzene',     'Indole'),
+    ('MX-8 Adenine-Thymine Complex Stack',      'C1',  'Adenine-Thymine Complex Stack',      'Adenine',     'Thymine'),
+    ('MX-1 Ethene-Ethine Complex',              'C2V', 'Ethene-Ethine Complex',              'Ethene',      'Ethine'),
+    ('MX-2 Benzene-Water Complex',              'CS',  'Benzene-Water Complex',              'Benzene',     'Water'),
+    ('MX-3 Benzene-Ammonia Complex',            'CS',  'Benzene-Ammonia Complex',            'Benzene',     'Ammonia'),
+    ('MX-4 Benzene-HCN Complex',                'CS',  'Benzene-HCN Complex',                'Benzene',     'HCN'),
+    ('DD-5 Benzene Dimer T-Shape',              'C2V', 'Benzene Dimer T-Shape',              'Benzene',     'Benzene'),
+    ('MX-6 Indole-Benzene Complex T-Shape',     'C1',  'Indole-Benzene Complex T-Shape',     'Benzene',     'Indole'),
+    ('MX-7 Phenol Dimer',                       'C1',  'Phenol Dimer',                       'Phenol',      'Phenol'),
+]
+for mol, (rxnname, pg, dimername, monoAname, monoBname) in enumerate(_tagl, start=1):
+    for d in dist:
+        rxnkey = f'{dbse}-{mol}-{d}'
+        # CP and unCP monomers (and both halves of a homodimer) share one label object
+        dimerlabel = f'{dimername} at {d} Req'
+        monoAlabel = sys.intern(f'{monoAname} from {dimerlabel}')
+        monoBlabel = sys.intern(f'{monoBname} from {dimerlabel}')
+        TAGL[sys.intern(rxnkey)]                 = f'{rxnname} at {d} Req, {pg}'
+        TAGL[sys.intern(f'{rxnkey}-dimer')]      = dimerlabel
+        TAGL[sys.intern(f'{rxnkey}-monoA-CP')]   = monoAlabel
+        TAGL[sys.intern(f'{rxnkey}-monoB-CP')]   = monoBlabel
+        TAGL[sys.intern(f'{rxnkey}-monoA-unCP')] = monoAlabel
+        TAGL[sys.intern(f'{rxnkey}-monoB-unCP')] = monoBlabel
 
 # <<< Geometry Specification Strings >>>
-GEOS = {}
+GEOS = qcdb.LazyGeometryDict()
 
-GEOS['%s-%s-dimer' % (dbse, '1-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-1-0.9-dimer'] = """
 0 1
 N   -0.535020551  -0.861570006   0.000000000
 H   -1.142058700  -0.825740733  -0.809565000
@@ -463,9 +200,9 @@ H    2.860659421  -0.035829274  -0.809565000
 H    1.718600721  -0.861570006   0.000000000
 H    2.860659421  -0.035829274   0.809565000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '1-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-1-1.0-dimer'] = """
 0 1
 N   -1.578718000  -0.046611000   0.000000000
 H   -2.158621000   0.136396000  -0.809565000
@@ -478,9 +215,9 @@ H    2.158621000  -0.136396000  -0.809565000
 H    0.849471000  -0.658193000   0.000000000
 H    2.158621000  -0.136396000   0.809565000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '1-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-1-1.2-dimer'] = """
 0 1
 N   -0.535020551  -0.861570006   0.000000000
 H   -1.142058700  -0.825740733  -0.809565000
@@ -493,9 +230,9 @@ H    3.611866511  -0.035829274  -0.809565000
 H    2.469807811  -0.861570006   0.000000000
 H    3.611866511  -0.035829274   0.809565000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '1-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-1-1.5-dimer'] = """
 0 1
 N   -0.535020551  -0.861570006   0.000000000
 H   -1.142058700  -0.825740733  -0.809565000
@@ -508,9 +245,9 @@ H    4.363073601  -0.035829274  -0.809565000
 H    3.221014901  -0.861570006   0.000000000
 H    4.363073601  -0.035829274   0.809565000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '1-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-1-2.0-dimer'] = """
 0 1
 N   -0.535020551  -0.861570006   0.000000000
 H   -1.142058700  -0.825740733  -0.809565000
@@ -523,9 +260,9 @@ H    5.615085419  -0.035829274  -0.809565000
 H    4.473026719  -0.861570006   0.000000000
 H    5.615085419  -0.035829274   0.809565000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '2-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-2-0.9-dimer'] = """
 0 1
 O   -0.956332646  -0.120638358   0.000000000
 H   -1.307535174   0.769703274   0.000000000
@@ -536,9 +273,9 @@ O    1.756426600   0.000000000   0.000000000
 H    2.068390928  -0.496847294  -0.758561000
 H    2.068390928  -0.496847294   0.758561000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '2-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-2-1.0-dimer'] = """
 0 1
 O   -1.551007000  -0.114520000   0.000000000
 H   -1.934259000   0.762503000   0.000000000
@@ -549,9 +286,9 @@ O    1.350625000   0.111469000   0.000000000
 H    1.680398000  -0.373741000  -0.758561000
 H    1.680398000  -0.373741000   0.758561000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '2-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-2-1.2-dimer'] = """
 0 1
 O   -0.956332646  -0.120638358   0.000000000
 H   -1.307535174   0.769703274   0.000000000
@@ -562,9 +299,9 @@ O    2.341902133   0.000000000   0.000000000
 H    2.653866461  -0.496847294  -0.758561000
 H    2.653866461  -0.496847294   0.758561000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '2-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-2-1.5-dimer'] = """
 0 1
 O   -0.956332646  -0.120638358   0.000000000
 H   -1.307535174   0.769703274   0.000000000
@@ -575,9 +312,9 @@ O    2.927377666   0.000000000   0.000000000
 H    3.239341994  -0.496847294  -0.758561000
 H    3.239341994  -0.496847294   0.758561000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '2-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-2-2.0-dimer'] = """
 0 1
 O   -0.956332646  -0.120638358   0.000000000
 H   -1.307535174   0.769703274   0.000000000
@@ -588,9 +325,9 @@ O    3.903170222   0.000000000   0.000000000
 H    4.215134550  -0.496847294  -0.758561000
 H    4.215134550  -0.496847294   0.758561000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '3-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-3-0.9-dimer'] = """
 0 1
 C   -1.434944263  -1.236643950   0.000000000
 O   -0.995009531   0.001876693   0.000000000
@@ -605,9 +342,9 @@ O    1.503291911   0.000000000   0.000000000
 H    3.278921791  -0.971514961   0.000000000
 H    0.751261211  -2.248465543   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '3-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-3-1.0-dimer'] = """
 0 1
 C   -1.888896000  -0.179692000   0.000000000
 O   -1.493280000   1.073689000   0.000000000
@@ -622,9 +359,9 @@ O    1.170435000   1.166590000   0.000000000
 H    2.979488000   0.258829000   0.000000000
 H    0.498833000  -1.107195000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '3-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-3-1.2-dimer'] = """
 0 1
 C   -1.434944263  -1.236643950   0.000000000
 O   -0.995009531   0.001876693   0.000000000
@@ -639,9 +376,9 @@ O    2.004389215   0.000000000   0.000000000
 H    3.780019095  -0.971514961   0.000000000
 H    1.252358515  -2.248465543   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '3-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-3-1.5-dimer'] = """
 0 1
 C   -1.434944263  -1.236643950   0.000000000
 O   -0.995009531   0.001876693   0.000000000
@@ -656,9 +393,9 @@ O    2.505486519   0.000000000   0.000000000
 H    4.281116399  -0.971514961   0.000000000
 H    1.753455819  -2.248465543   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '3-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-3-2.0-dimer'] = """
 0 1
 C   -1.434944263  -1.236643950   0.000000000
 O   -0.995009531   0.001876693   0.000000000
@@ -673,9 +410,9 @@ O    3.340648692   0.000000000   0.000000000
 H    5.116278572  -0.971514961   0.000000000
 H    2.588617992  -2.248465543   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '4-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-4-0.9-dimer'] = """
 0 1
 C   -0.604120150  -1.070346233   0.000000000
 O    0.000000000   0.000000000   0.000000000
@@ -692,9 +429,9 @@ H    3.259710032   0.713812161   0.000000000
 H    1.656505975   0.000000000   0.000000000
 H    4.343047949  -1.288496220   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '4-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-4-1.0-dimer'] = """
 0 1
 C   -2.018649000   0.052883000   0.000000000
 O   -1.452200000   1.143634000   0.000000000
@@ -711,9 +448,9 @@ H    1.964596000   1.977036000   0.000000000
 H    0.387244000   1.207782000   0.000000000
 H    3.117061000   0.013701000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '4-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-4-1.2-dimer'] = """
 0 1
 C   -0.604120150  -1.070346233   0.000000000
 O    0.000000000   0.000000000   0.000000000
@@ -730,9 +467,9 @@ H    3.811878691   0.713812161   0.000000000
 H    2.208674634   0.000000000   0.000000000
 H    4.895216608  -1.288496220   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '4-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-4-1.5-dimer'] = """
 0 1
 C   -0.604120150  -1.070346233   0.000000000
 O    0.000000000   0.000000000   0.000000000
@@ -749,9 +486,9 @@ H    4.364047350   0.713812161   0.000000000
 H    2.760843293   0.000000000   0.000000000
 H    5.447385267  -1.288496220   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '4-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-4-2.0-dimer'] = """
 0 1
 C   -0.604120150  -1.070346233   0.000000000
 O    0.000000000   0.000000000   0.000000000
@@ -768,9 +505,9 @@ H    5.284328447   0.713812161   0.000000000
 H    3.681124390   0.000000000   0.000000000
 H    6.367666364  -1.288496220   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '5-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-5-0.9-dimer'] = """
 0 1
 O    0.000000000   0.000000000   0.000000000
 C   -0.664243938   1.036879148   0.000000000
@@ -799,9 +536,9 @@ H    1.597100890   0.000000000   0.000000000
 H    4.984334888   2.217778579   0.000000000
 H    2.815046715  -2.013694138   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '5-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-5-1.0-dimer'] = """
 0 1
 O   -1.466332000   1.012169000   0.000000000
 C   -0.628146000   1.914268000   0.000000000
@@ -830,9 +567,9 @@ H   -1.023251000  -0.706182000   0.000000000
 H    1.970027000  -3.432385000   0.000000000
 H   -2.669062000  -2.388342000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '5-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-5-1.2-dimer'] = """
 0 1
 O    0.000000000   0.000000000   0.000000000
 C   -0.664243938   1.036879148   0.000000000
@@ -861,9 +598,9 @@ H    2.129467854   0.000000000   0.000000000
 H    5.516701852   2.217778579   0.000000000
 H    3.347413679  -2.013694138   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '5-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-5-1.5-dimer'] = """
 0 1
 O    0.000000000   0.000000000   0.000000000
 C   -0.664243938   1.036879148   0.000000000
@@ -892,9 +629,9 @@ H    2.661834818   0.000000000   0.000000000
 H    6.049068816   2.217778579   0.000000000
 H    3.879780643  -2.013694138   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '5-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-5-2.0-dimer'] = """
 0 1
 O    0.000000000   0.000000000   0.000000000
 C   -0.664243938   1.036879148   0.000000000
@@ -923,9 +660,9 @@ H    3.549113090   0.000000000   0.000000000
 H    6.936347088   2.217778579   0.000000000
 H    4.767058915  -2.013694138   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '6-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-6-0.9-dimer'] = """
 0 1
 O   -0.969652624  -2.245611164  -0.386822525
 N   -1.037789793   0.004508753  -0.001131127
@@ -955,9 +692,9 @@ N    1.620216197  -2.272201547   0.435153550
 H    2.101618920  -3.145888174   0.315408858
 H    0.644520940  -2.270442069   0.133172072
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '6-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-6-1.0-dimer'] = """
 0 1
 O   -1.397621000  -1.885837000  -0.367306000
 N   -1.464255000   0.364183000   0.019230000
@@ -987,9 +724,9 @@ N    1.388312000  -1.908304000   0.419815000
 H    1.869471000  -2.781277000   0.294038000
 H    0.408907000  -1.907994000   0.130086000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '6-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-6-1.2-dimer'] = """
 0 1
 O   -0.969652624  -2.245611164  -0.386822525
 N   -1.037789793   0.004508753  -0.001131127
@@ -1019,9 +756,9 @@ N    2.178047325  -2.272201547   0.435153550
 H    2.659450048  -3.145888174   0.315408858
 H    1.202352068  -2.270442069   0.133172072
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '6-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-6-1.5-dimer'] = """
 0 1
 O   -0.969652624  -2.245611164  -0.386822525
 N   -1.037789793   0.004508753  -0.001131127
@@ -1051,9 +788,9 @@ N    2.735878453  -2.272201547   0.435153550
 H    3.217281176  -3.145888174   0.315408858
 H    1.760183196  -2.270442069   0.133172072
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '6-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-6-2.0-dimer'] = """
 0 1
 O   -0.969652624  -2.245611164  -0.386822525
 N   -1.037789793   0.004508753  -0.001131127
@@ -1083,9 +820,9 @@ N    3.665597001  -2.272201547   0.435153550
 H    4.146999724  -3.145888174   0.315408858
 H    2.689901744  -2.270442069   0.133172072
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '7-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-7-0.9-dimer'] = """
 0 1
 N    0.000000000   0.000000000   0.000000000
 C   -0.738685058  -0.157889771   1.110355410
@@ -1120,9 +857,9 @@ H    5.195022957   0.354841198   3.233018736
 H    5.183915029  -1.373098243   2.962397530
 H    6.542374655  -0.403617008   2.368385087
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '7-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-7-1.0-dimer'] = """
 0 1
 N    0.935015000  -0.027980000  -0.378892000
 C    1.673964000  -0.035777000   0.742432000
@@ -1157,9 +894,9 @@ H   -4.443928000  -0.830257000   2.769566000
 H   -4.426706000   0.918618000   2.753026000
 H   -5.788397000   0.050553000   2.024728000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '7-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-7-1.2-dimer'] = """
 0 1
 N    0.000000000   0.000000000   0.000000000
 C   -0.738685058  -0.157889771   1.110355410
@@ -1194,9 +931,9 @@ H    5.740678614   0.354841198   3.233018736
 H    5.729570686  -1.373098243   2.962397530
 H    7.088030312  -0.403617008   2.368385087
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '7-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-7-1.5-dimer'] = """
 0 1
 N    0.000000000   0.000000000   0.000000000
 C   -0.738685058  -0.157889771   1.110355410
@@ -1231,9 +968,9 @@ H    6.286334271   0.354841198   3.233018736
 H    6.275226343  -1.373098243   2.962397530
 H    7.633685969  -0.403617008   2.368385087
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '7-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-7-2.0-dimer'] = """
 0 1
 N    0.000000000   0.000000000   0.000000000
 C   -0.738685058  -0.157889771   1.110355410
@@ -1268,9 +1005,9 @@ H    7.195760366   0.354841198   3.233018736
 H    7.184652438  -1.373098243   2.962397530
 H    8.543112064  -0.403617008   2.368385087
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '8-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-8-0.9-dimer'] = """
 0 1
 C    0.000000000   0.000000000   0.000000000
 H    0.364514644   0.513239461  -0.888512354
@@ -1285,9 +1022,9 @@ H    2.981975165  -0.513105641  -0.888589641
 H    2.981975165  -0.513239461   0.888512354
 H    2.982274086   1.026226426   0.000077278
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '8-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-8-1.0-dimer'] = """
 0 1
 C    0.000000000  -0.000140000   1.859161000
 H   -0.888551000   0.513060000   1.494685000
@@ -1302,9 +1039,9 @@ H   -0.888551000  -0.513060000  -1.494685000
 H    0.888551000  -0.513060000  -1.494685000
 H    0.000000000   1.026339000  -1.494868000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '8-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-8-1.2-dimer'] = """
 0 1
 C    0.000000000   0.000000000   0.000000000
 H    0.364514644   0.513239461  -0.888512354
@@ -1319,9 +1056,9 @@ H    4.097471768  -0.513105641  -0.888589641
 H    4.097471768  -0.513239461   0.888512354
 H    4.097770689   1.026226426   0.000077278
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '8-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-8-1.5-dimer'] = """
 0 1
 C    0.000000000   0.000000000   0.000000000
 H    0.364514644   0.513239461  -0.888512354
@@ -1336,9 +1073,9 @@ H    5.212968371  -0.513105641  -0.888589641
 H    5.212968371  -0.513239461   0.888512354
 H    5.213267292   1.026226426   0.000077278
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '8-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-8-2.0-dimer'] = """
 0 1
 C    0.000000000   0.000000000   0.000000000
 H    0.364514644   0.513239461  -0.888512354
@@ -1353,9 +1090,9 @@ H    7.072129377  -0.513105641  -0.888589641
 H    7.072129377  -0.513239461   0.888512354
 H    7.072428298   1.026226426   0.000077278
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '9-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-9-0.9-dimer'] = """
 0 1
 C    0.000000000  -0.471925000   0.471925000
 C    0.000000000   0.471925000  -0.471925000
@@ -1372,9 +1109,9 @@ H    2.423413800  -0.872422000  -0.872422000
 H    4.270596800   0.870464000   0.870464000
 H    4.270596800  -0.870464000  -0.870464000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '9-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-9-1.0-dimer'] = """
 0 1
 C   -0.471925000  -0.471925000  -1.859111000
 C    0.471925000   0.471925000  -1.859111000
@@ -1391,9 +1128,9 @@ H    0.872422000  -0.872422000   0.936125000
 H   -0.870464000   0.870464000   2.783308000
 H    0.870464000  -0.870464000   2.783308000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '9-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-9-1.2-dimer'] = """
 0 1
 C    0.000000000  -0.471925000   0.471925000
 C    0.000000000   0.471925000  -0.471925000
@@ -1410,9 +1147,9 @@ H    3.538880400  -0.872422000  -0.872422000
 H    5.386063400   0.870464000   0.870464000
 H    5.386063400  -0.870464000  -0.870464000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '9-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-9-1.5-dimer'] = """
 0 1
 C    0.000000000  -0.471925000   0.471925000
 C    0.000000000   0.471925000  -0.471925000
@@ -1429,9 +1166,9 @@ H    4.654347000  -0.872422000  -0.872422000
 H    6.501530000   0.870464000   0.870464000
 H    6.501530000  -0.870464000  -0.870464000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '9-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-9-2.0-dimer'] = """
 0 1
 C    0.000000000  -0.471925000   0.471925000
 C    0.000000000   0.471925000  -0.471925000
@@ -1448,9 +1185,9 @@ H    6.513458000  -0.872422000  -0.872422000
 H    8.360641000   0.870464000   0.870464000
 H    8.360641000  -0.870464000  -0.870464000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '10-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-10-0.9-dimer'] = """
 0 1
 C    0.000011002   0.036291078  -1.393218002
 C   -0.000011075  -1.188401879  -0.728035925
@@ -1472,9 +1209,9 @@ H    3.816671906   0.089163973   1.019318994
 H    2.366964900   0.000000000   0.000000000
 H    3.816671841  -0.927338119  -0.432440941
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '10-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-10-1.0-dimer'] = """
 0 1
 C    1.393218000   0.036291000  -0.633280000
 C    0.728036000  -1.188402000  -0.633302000
@@ -1496,9 +1233,9 @@ H   -1.019319000   0.089164000   3.446377000
 H    0.000000000   0.000000000   1.996670000
 H    0.432441000  -0.927338000   3.446377000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '10-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-10-1.2-dimer'] = """
 0 1
 C    0.000011002   0.036291078  -1.393218002
 C   -0.000011075  -1.188401879  -0.728035925
@@ -1520,9 +1257,9 @@ H    4.605660206   0.089163973   1.019318994
 H    3.155953200   0.000000000   0.000000000
 H    4.605660141  -0.927338119  -0.432440941
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '10-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-10-1.5-dimer'] = """
 0 1
 C    0.000011002   0.036291078  -1.393218002
 C   -0.000011075  -1.188401879  -0.728035925
@@ -1544,9 +1281,9 @@ H    5.394648506   0.089163973   1.019318994
 H    3.944941500   0.000000000   0.000000000
 H    5.394648441  -0.927338119  -0.432440941
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '10-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-10-2.0-dimer'] = """
 0 1
 C    0.000011002   0.036291078  -1.393218002
 C   -0.000011075  -1.188401879  -0.728035925
@@ -1568,9 +1305,9 @@ H    6.709629006   0.089163973   1.019318994
 H    5.259922000   0.000000000   0.000000000
 H    6.709628941  -0.927338119  -0.432440941
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '11-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-11-0.9-dimer'] = """
 0 1
 C    0.629051507  -1.244058476   0.000000000
 C    0.314072291  -0.622134657   1.206205000
@@ -1599,9 +1336,9 @@ H    4.505594855  -2.209685917   0.000000000
 H    3.948089550  -1.104085746  -2.143798000
 H    2.824770156   1.102778154  -2.142315000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '11-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-11-1.0-dimer'] = """
 0 1
 C   -1.047825000  -1.421674000   0.000000000
 C   -1.454503000  -0.855446000   1.206205000
@@ -1630,9 +1367,9 @@ H    3.303042000  -1.723270000   0.000000000
 H    2.582494000  -0.716307000  -2.143798000
 H    1.133853000   1.292059000  -2.142315000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '11-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-11-1.2-dimer'] = """
 0 1
 C    0.629051507  -1.244058476   0.000000000
 C    0.314072291  -0.622134657   1.206205000
@@ -1661,9 +1398,9 @@ H    5.635161766  -2.209685917   0.000000000
 H    5.077656461  -1.104085746  -2.143798000
 H    3.954337067   1.102778154  -2.142315000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '11-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-11-1.5-dimer'] = """
 0 1
 C    0.629051507  -1.244058476   0.000000000
 C    0.314072291  -0.622134657   1.206205000
@@ -1692,9 +1429,9 @@ H    6.764728677  -2.209685917   0.000000000
 H    6.207223372  -1.104085746  -2.143798000
 H    5.083903978   1.102778154  -2.142315000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '11-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-11-2.0-dimer'] = """
 0 1
 C    0.629051507  -1.244058476   0.000000000
 C    0.314072291  -0.622134657   1.206205000
@@ -1723,9 +1460,9 @@ H    8.647340194  -2.209685917   0.000000000
 H    8.089834889  -1.104085746  -2.143798000
 H    6.966515495   1.102778154  -2.142315000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '12-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-12-0.9-dimer'] = """
 0 1
 C    0.395653045   1.059432142  -0.696139000
 C    0.395653045   1.059432142   0.696139000
@@ -1750,9 +1487,9 @@ H    2.643057716  -1.147744338   2.062399000
 H    2.643057716  -1.147744338  -2.062399000
 H    3.609496345   1.152471205  -2.061864000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '12-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-12-1.0-dimer'] = """
 0 1
 C   -1.247189000  -1.171821000  -0.696139000
 C   -1.247189000  -1.171821000   0.696139000
@@ -1777,9 +1514,9 @@ H    1.320858000   1.067061000   2.062399000
 H    1.320858000   1.067061000  -2.062399000
 H   -0.810376000   2.364303000  -2.061864000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '12-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-12-1.2-dimer'] = """
 0 1
 C    0.395653045   1.059432142  -0.696139000
 C    0.395653045   1.059432142   0.696139000
@@ -1804,9 +1541,9 @@ H    3.686886981  -1.147744338   2.062399000
 H    3.686886981  -1.147744338  -2.062399000
 H    4.653325610   1.152471205  -2.061864000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '12-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-12-1.5-dimer'] = """
 0 1
 C    0.395653045   1.059432142  -0.696139000
 C    0.395653045   1.059432142   0.696139000
@@ -1831,9 +1568,9 @@ H    4.730716246  -1.147744338   2.062399000
 H    4.730716246  -1.147744338  -2.062399000
 H    5.697154875   1.152471205  -2.061864000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '12-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-12-2.0-dimer'] = """
 0 1
 C    0.395653045   1.059432142  -0.696139000
 C    0.395653045   1.059432142   0.696139000
@@ -1858,9 +1595,9 @@ H    6.470431688  -1.147744338   2.062399000
 H    6.470431688  -1.147744338  -2.062399000
 H    7.436870317   1.152471205  -2.061864000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '13-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-13-0.9-dimer'] = """
 0 1
 N   -0.277905006   1.293679543   0.176141970
 C   -0.313143400   0.778657200  -1.090194030
@@ -1889,9 +1626,9 @@ C    2.971118189  -0.551482081   1.292935970
 O    2.866596791  -1.034239706   2.404014970
 H    3.384676629  -2.285950208   0.331021970
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '13-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-13-1.0-dimer'] = """
 0 1
 N    2.011359000  -1.213207000  -0.098067000
 C    2.025708000  -0.697180000  -1.364403000
@@ -1920,9 +1657,9 @@ C   -1.645991000   0.485211000   1.018727000
 O   -1.561109000   0.971806000   2.129806000
 H   -2.129463000   2.201505000   0.056813000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '13-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-13-1.2-dimer'] = """
 0 1
 N   -0.277905006   1.293679543   0.176141970
 C   -0.313143400   0.778657200  -1.090194030
@@ -1951,9 +1688,9 @@ C    3.980716385  -0.551482081   1.292935970
 O    3.876194987  -1.034239706   2.404014970
 H    4.394274825  -2.285950208   0.331021970
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '13-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-13-1.5-dimer'] = """
 0 1
 N   -0.277905006   1.293679543   0.176141970
 C   -0.313143400   0.778657200  -1.090194030
@@ -1982,9 +1719,9 @@ C    4.990314580  -0.551482081   1.292935970
 O    4.885793182  -1.034239706   2.404014970
 H    5.403873020  -2.285950208   0.331021970
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '13-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-13-2.0-dimer'] = """
 0 1
 N   -0.277905006   1.293679543   0.176141970
 C   -0.313143400   0.778657200  -1.090194030
@@ -2013,9 +1750,9 @@ C    6.672978240  -0.551482081   1.292935970
 O    6.568456842  -1.034239706   2.404014970
 H    7.086536680  -2.285950208   0.331021970
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '14-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-14-0.9-dimer'] = """
 0 1
 C    0.000000000   0.000000000   0.000000000
 C   -0.044485647  -1.177978626   0.743160105
@@ -2048,9 +1785,9 @@ H    2.973148444  -2.718261443   2.297634930
 H    3.103876306  -1.056446212  -2.398978775
 H    3.012441631   1.398036276  -2.881807744
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '14-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-14-1.0-dimer'] = """
 0 1
 C   -0.021074000   1.531861000  -1.363935000
 C   -1.274679000   0.974103000  -1.607410000
@@ -2083,9 +1820,9 @@ H   -3.038997000  -1.320385000   1.146840000
 H    1.807574000  -2.036696000   0.233304000
 H    3.502879000  -0.348534000   0.969523000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '14-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-14-1.2-dimer'] = """
 0 1
 C    0.000000000   0.000000000   0.000000000
 C   -0.044485647  -1.177978626   0.743160105
@@ -2118,9 +1855,9 @@ H    3.948740974  -2.718261443   2.297634930
 H    4.079468836  -1.056446212  -2.398978775
 H    3.988034161   1.398036276  -2.881807744
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '14-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-14-1.5-dimer'] = """
 0 1
 C    0.000000000   0.000000000   0.000000000
 C   -0.044485647  -1.177978626   0.743160105
@@ -2153,9 +1890,9 @@ H    4.924333504  -2.718261443   2.297634930
 H    5.055061366  -1.056446212  -2.398978775
 H    4.963626691   1.398036276  -2.881807744
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '14-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-14-2.0-dimer'] = """
 0 1
 C    0.000000000   0.000000000   0.000000000
 C   -0.044485647  -1.177978626   0.743160105
@@ -2188,9 +1925,9 @@ H    6.550321054  -2.718261443   2.297634930
 H    6.681048916  -1.056446212  -2.398978775
 H    6.589614241   1.398036276  -2.881807744
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '15-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-15-0.9-dimer'] = """
 0 1
 N    0.067390759   1.213806097  -1.171192513
 C   -0.034440687   0.160916029  -2.035179690
@@ -2225,9 +1962,9 @@ C    2.814781928   0.814169728  -1.152798148
 O    2.732113465   1.513854058  -2.149163262
 H    3.033823338   2.322516737   0.179118562
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '15-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-15-1.0-dimer'] = """
 0 1
 N    0.279301000   2.406839000  -0.605752000
 C   -1.084857000   2.445746000  -0.551161000
@@ -2262,9 +1999,9 @@ C    0.068470000  -0.119176000  -2.376376000
 O   -0.039788000   0.722701000  -3.253108000
 H    2.085329000  -0.276018000  -2.445458000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '15-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-15-1.2-dimer'] = """
 0 1
 N    0.067390759   1.213806097  -1.171192513
 C   -0.034440687   0.160916029  -2.035179690
@@ -2299,9 +2036,9 @@ C    3.770563049   0.814169728  -1.152798148
 O    3.687894586   1.513854058  -2.149163262
 H    3.989604459   2.322516737   0.179118562
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '15-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-15-1.5-dimer'] = """
 0 1
 N    0.067390759   1.213806097  -1.171192513
 C   -0.034440687   0.160916029  -2.035179690
@@ -2336,9 +2073,9 @@ C    4.726344171   0.814169728  -1.152798148
 O    4.643675708   1.513854058  -2.149163262
 H    4.945385581   2.322516737   0.179118562
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '15-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-15-2.0-dimer'] = """
 0 1
 N    0.067390759   1.213806097  -1.171192513
 C   -0.034440687   0.160916029  -2.035179690
@@ -2373,9 +2110,9 @@ C    6.319312707   0.814169728  -1.152798148
 O    6.236644244   1.513854058  -2.149163262
 H    6.538354117   2.322516737   0.179118562
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '16-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-16-0.9-dimer'] = """
 0 1
 C    0.000000000  -0.667578000   0.000000000
 C    0.000000000   0.667578000   0.000000000
@@ -2390,9 +2127,9 @@ C    3.542697900   0.000000000   0.000000000
 H    2.476809900   0.000000000   0.000000000
 H    5.813386900   0.000000000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '16-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-16-1.0-dimer'] = """
 0 1
 C    0.000000000  -0.667578000  -2.124659000
 C    0.000000000   0.667578000  -2.124659000
@@ -2407,9 +2144,9 @@ C    0.000000000   0.000000000   1.693240000
 H    0.000000000   0.000000000   0.627352000
 H    0.000000000   0.000000000   3.963929000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '16-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-16-1.2-dimer'] = """
 0 1
 C    0.000000000  -0.667578000   0.000000000
 C    0.000000000   0.667578000   0.000000000
@@ -2424,9 +2161,9 @@ C    4.368301200   0.000000000   0.000000000
 H    3.302413200   0.000000000   0.000000000
 H    6.638990200   0.000000000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '16-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-16-1.5-dimer'] = """
 0 1
 C    0.000000000  -0.667578000   0.000000000
 C    0.000000000   0.667578000   0.000000000
@@ -2441,9 +2178,9 @@ C    5.193904500   0.000000000   0.000000000
 H    4.128016500   0.000000000   0.000000000
 H    7.464593500   0.000000000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '16-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-16-2.0-dimer'] = """
 0 1
 C    0.000000000  -0.667578000   0.000000000
 C    0.000000000   0.667578000   0.000000000
@@ -2458,9 +2195,9 @@ C    6.569910000   0.000000000   0.000000000
 H    5.504022000   0.000000000   0.000000000
 H    8.840599000   0.000000000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '17-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-17-0.9-dimer'] = """
 0 1
 C    0.068736158   1.392383840  -1.207543000
 C    0.000000000   0.000000000  -1.207904000
@@ -2480,9 +2217,9 @@ O    3.175061618   0.124369730   0.000000000
 H    3.265337861   1.079117991   0.000000000
 H    2.221117117   0.000000000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '17-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-17-1.0-dimer'] = """
 0 1
 C    0.780612000  -0.609888000  -1.207543000
 C    0.478404000   0.751041000  -1.207904000
@@ -2502,9 +2239,9 @@ O   -2.788527000  -0.274485000   0.000000000
 H   -2.622911000  -1.219083000   0.000000000
 H   -1.901510000   0.097911000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '17-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-17-1.2-dimer'] = """
 0 1
 C    0.068736158   1.392383840  -1.207543000
 C    0.000000000   0.000000000  -1.207904000
@@ -2524,9 +2261,9 @@ O    3.915433991   0.124369730   0.000000000
 H    4.005710234   1.079117991   0.000000000
 H    2.961489490   0.000000000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '17-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-17-1.5-dimer'] = """
 0 1
 C    0.068736158   1.392383840  -1.207543000
 C    0.000000000   0.000000000  -1.207904000
@@ -2546,9 +2283,9 @@ O    4.655806363   0.124369730   0.000000000
 H    4.746082606   1.079117991   0.000000000
 H    3.701861862   0.000000000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '17-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-17-2.0-dimer'] = """
 0 1
 C    0.068736158   1.392383840  -1.207543000
 C    0.000000000   0.000000000  -1.207904000
@@ -2568,9 +2305,9 @@ O    5.889760317   0.124369730   0.000000000
 H    5.980036560   1.079117991   0.000000000
 H    4.935815816   0.000000000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '18-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-18-0.9-dimer'] = """
 0 1
 C    0.000000000   0.000000000  -1.207108000
 C   -0.094723910  -0.690687169   0.000000000
@@ -2591,9 +2328,9 @@ H    3.685723470   0.316960994  -0.806073000
 H    3.685723470   0.316960994   0.806073000
 H    2.324338249   0.000000000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '18-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-18-1.0-dimer'] = """
 0 1
 C   -0.739281000   0.515879000  -1.207108000
 C   -1.426144000   0.396545000   0.000000000
@@ -2614,9 +2351,9 @@ H    0.759549000  -3.145948000  -0.806073000
 H    0.759549000  -3.145948000   0.806073000
 H    0.044417000  -1.944940000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '18-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-18-1.2-dimer'] = """
 0 1
 C    0.000000000   0.000000000  -1.207108000
 C   -0.094723910  -0.690687169   0.000000000
@@ -2637,9 +2374,9 @@ H    4.460502886   0.316960994  -0.806073000
 H    4.460502886   0.316960994   0.806073000
 H    3.099117665   0.000000000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '18-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-18-1.5-dimer'] = """
 0 1
 C    0.000000000   0.000000000  -1.207108000
 C   -0.094723910  -0.690687169   0.000000000
@@ -2660,9 +2397,9 @@ H    5.235282302   0.316960994  -0.806073000
 H    5.235282302   0.316960994   0.806073000
 H    3.873897081   0.000000000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '18-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-18-2.0-dimer'] = """
 0 1
 C    0.000000000   0.000000000  -1.207108000
 C   -0.094723910  -0.690687169   0.000000000
@@ -2683,9 +2420,9 @@ H    6.526581329   0.316960994  -0.806073000
 H    6.526581329   0.316960994   0.806073000
 H    5.165196108   0.000000000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '19-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-19-0.9-dimer'] = """
 0 1
 C   -0.023100946   0.696978594   1.207702000
 C   -0.046160335   1.393808033   0.000000000
@@ -2705,9 +2442,9 @@ N    4.308034683   0.304536859   0.000000000
 C    3.151543935   0.145763954   0.000000000
 H    2.093660645   0.000000000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '19-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-19-1.0-dimer'] = """
 0 1
 C   -0.709774000  -0.990423000   1.207702000
 C   -1.406534000  -0.965353000   0.000000000
@@ -2727,9 +2464,9 @@ N   -0.003412000   3.535393000   0.000000000
 C    0.075196000   2.370704000   0.000000000
 H    0.147629000   1.305285000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '19-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-19-1.2-dimer'] = """
 0 1
 C   -0.023100946   0.696978594   1.207702000
 C   -0.046160335   1.393808033   0.000000000
@@ -2749,9 +2486,9 @@ N    5.005921565   0.304536859   0.000000000
 C    3.849430817   0.145763954   0.000000000
 H    2.791547527   0.000000000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '19-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-19-1.5-dimer'] = """
 0 1
 C   -0.023100946   0.696978594   1.207702000
 C   -0.046160335   1.393808033   0.000000000
@@ -2771,9 +2508,9 @@ N    5.703808447   0.304536859   0.000000000
 C    4.547317699   0.145763954   0.000000000
 H    3.489434409   0.000000000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '19-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-19-2.0-dimer'] = """
 0 1
 C   -0.023100946   0.696978594   1.207702000
 C   -0.046160335   1.393808033   0.000000000
@@ -2793,9 +2530,9 @@ N    6.866953250   0.304536859   0.000000000
 C    5.710462502   0.145763954   0.000000000
 H    4.652579212   0.000000000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '20-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-20-0.9-dimer'] = """
 0 1
 C   -1.080615000   0.000000000   0.000000000
 C   -1.779254000  -1.206008000   0.000000000
@@ -2824,9 +2561,9 @@ H    2.185453067   0.000000000   2.475399000
 H    2.188807067  -2.143565000   1.238232000
 H    2.188807067  -2.143565000  -1.238232000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '20-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-20-1.0-dimer'] = """
 0 1
 C    0.000000000   0.000000000   1.059035000
 C    0.000000000  -1.206008000   1.757674000
@@ -2855,9 +2592,9 @@ H    2.475399000   0.000000000  -2.450322000
 H    1.238232000  -2.143565000  -2.453676000
 H   -1.238232000  -2.143565000  -2.453676000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '20-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-20-1.2-dimer'] = """
 0 1
 C   -1.080615000   0.000000000   0.000000000
 C   -1.779254000  -1.206008000   0.000000000
@@ -2886,9 +2623,9 @@ H    2.915319867   0.000000000   2.475399000
 H    2.918673867  -2.143565000   1.238232000
 H    2.918673867  -2.143565000  -1.238232000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '20-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-20-1.5-dimer'] = """
 0 1
 C   -1.080615000   0.000000000   0.000000000
 C   -1.779254000  -1.206008000   0.000000000
@@ -2917,9 +2654,9 @@ H    3.645186667   0.000000000   2.475399000
 H    3.648540667  -2.143565000   1.238232000
 H    3.648540667  -2.143565000  -1.238232000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '20-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-20-2.0-dimer'] = """
 0 1
 C   -1.080615000   0.000000000   0.000000000
 C   -1.779254000  -1.206008000   0.000000000
@@ -2948,9 +2685,9 @@ H    4.861631333   0.000000000   2.475399000
 H    4.864985333  -2.143565000   1.238232000
 H    4.864985333  -2.143565000  -1.238232000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '21-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-21-0.9-dimer'] = """
 0 1
 C   -0.052652077  -1.393225783   0.000000000
 C   -0.025543347  -0.696940104  -1.208292000
@@ -2983,9 +2720,9 @@ H    4.303017780  -4.434822780   0.000000000
 H    6.655123584  -3.694570139   0.000000000
 H    7.235724321  -1.294593877   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '21-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-21-1.0-dimer'] = """
 0 1
 C    2.511900000   1.625015000   0.000000000
 C    2.713009000   0.957854000  -1.208292000
@@ -3018,9 +2755,9 @@ H   -2.807757000   3.009786000   0.000000000
 H   -4.790599000   1.543937000   0.000000000
 H   -4.558019000  -0.914292000   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '21-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-21-1.2-dimer'] = """
 0 1
 C   -0.052652077  -1.393225783   0.000000000
 C   -0.025543347  -0.696940104  -1.208292000
@@ -3053,9 +2790,9 @@ H    4.972283588  -4.434822780   0.000000000
 H    7.324389392  -3.694570139   0.000000000
 H    7.904990129  -1.294593877   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '21-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-21-1.5-dimer'] = """
 0 1
 C   -0.052652077  -1.393225783   0.000000000
 C   -0.025543347  -0.696940104  -1.208292000
@@ -3088,9 +2825,9 @@ H    5.641549396  -4.434822780   0.000000000
 H    7.993655200  -3.694570139   0.000000000
 H    8.574255937  -1.294593877   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '21-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-21-2.0-dimer'] = """
 0 1
 C   -0.052652077  -1.393225783   0.000000000
 C   -0.025543347  -0.696940104  -1.208292000
@@ -3123,9 +2860,9 @@ H    6.756992410  -4.434822780   0.000000000
 H    9.109098214  -3.694570139   0.000000000
 H    9.689698951  -1.294593877   0.000000000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '22-0.9')] = qcdb.Molecule("""
+GEOS[f'{dbse}-22-0.9-dimer'] = """
 0 1
 C   -1.445967355  -1.221065858   0.265808750
 O   -0.945229913  -0.047318091  -0.209467563
@@ -3156,9 +2893,9 @@ H    3.877956013  -4.387511286  -1.908204233
 H    5.102623102  -3.077497147  -0.194005162
 H    4.116289930  -1.004251641   0.722333197
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '22-1.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-22-1.0-dimer'] = """
 0 1
 C   -2.007106000   0.763846000  -0.108351000
 O   -1.388504000   1.929852000  -0.443121000
@@ -3189,9 +2926,9 @@ H    3.833023000  -2.481154000  -0.856667000
 H    4.613763000  -1.185010000   1.109263000
 H    3.459885000   0.903038000   1.756949000
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '22-1.2')] = qcdb.Molecule("""
+GEOS[f'{dbse}-22-1.2-dimer'] = """
 0 1
 C   -1.445967355  -1.221065858   0.265808750
 O   -0.945229913  -0.047318091  -0.209467563
@@ -3222,9 +2959,9 @@ H    4.459119039  -4.387511286  -1.908204233
 H    5.683786128  -3.077497147  -0.194005162
 H    4.697452956  -1.004251641   0.722333197
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '22-1.5')] = qcdb.Molecule("""
+GEOS[f'{dbse}-22-1.5-dimer'] = """
 0 1
 C   -1.445967355  -1.221065858   0.265808750
 O   -0.945229913  -0.047318091  -0.209467563
@@ -3255,9 +2992,9 @@ H    5.040282065  -4.387511286  -1.908204233
 H    6.264949154  -3.077497147  -0.194005162
 H    5.278615982  -1.004251641   0.722333197
 units angstrom
-""")
+"""
 
-GEOS['%s-%s-dimer' % (dbse, '22-2.0')] = qcdb.Molecule("""
+GEOS[f'{dbse}-22-2.0-dimer'] = """
 0 1
 C   -1.445967355  -1.221065858   0.265808750
 O   -0.945229913  -0.047318091  -0.209467563
@@ -3288,14 +3025,16 @@ H    6.008887108  -4.387511286  -1.908204233
 H    7.233554197  -3.077497147  -0.194005162
 H    6.247221025  -1.004251641   0.722333197
 units angstrom
-""")
+"""
 
 # <<< Derived Geometry Strings >>>
 for rxn in HRXN:
-    GEOS['%s-%s-monoA-unCP' % (dbse, rxn)] = GEOS['%s-%s-dimer' % (dbse, rxn)].extract_fragments(1)
-    GEOS['%s-%s-monoB-unCP' % (dbse, rxn)] = GEOS['%s-%s-dimer' % (dbse, rxn)].extract_fragments(2)
-    GEOS['%s-%s-monoA-CP'   % (dbse, rxn)] = GEOS['%s-%s-dimer' % (dbse, rxn)].extract_fragments(1, 2)
-    GEOS['%s-%s-monoB-CP'   % (dbse, rxn)] = GEOS['%s-%s-dimer' % (dbse, rxn)].extract_fragments(2, 1)
+    rxnkey = f'{dbse}-{rxn}'
+    dimer = sys.intern(f'{rxnkey}-dimer')
+    GEOS[sys.intern(f'{rxnkey}-monoA-unCP')] = GEOS.fragments(dimer, 1)
+    GEOS[sys.intern(f'{rxnkey}-monoB-unCP')] = GEOS.fragments(dimer, 2)
+    GEOS[sys.intern(f'{rxnkey}-monoA-CP')]   = GEOS.fragments(dimer, 1, 2)
+    GEOS[sys.intern(f'{rxnkey}-monoB-CP')]   = GEOS.fragments(dimer, 2, 1)
 
 #########################################################################
 
@@ -43,7 +43,6 @@
   - ``'DD'`` dispersion-dominated systems
 
 """
-import re
 import qcdb
 
 # <<< S66 Database Module >>>
@@ -46,7 +46,6 @@
 
 
 """
-import re
 import qcdb
 
 # <<< S66by8 Database Module >>>